@@ -3,6 +3,10 @@ ASGI config for SoundCloudClone project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+In production it is served by gunicorn with uvicorn workers (see the
+Procfile). ``uvicorn[standard]`` installs uvloop and httptools, which the
+worker picks up automatically in place of asyncio's default loop and h11.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
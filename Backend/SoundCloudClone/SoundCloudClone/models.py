@@ -1,30 +1,74 @@
 from django.db import models
+from django.db.models.functions import Lower
+
+class UsuarioQuerySet(models.QuerySet):
+    def by_email(self, email):
+        # Same expression as the unique constraint, so the lookup uses its index.
+        return self.alias(email_lower=Lower('email')).filter(email_lower=email.lower())
+
 
 class Usuario(models.Model):
     nombre = models.CharField(max_length=100)
-    email = models.EmailField(unique=True)
-    password_hash = models.CharField(max_length=255)
+    email = models.EmailField()
+    password_hash = models.CharField(max_length=128)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = UsuarioQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='usuario_email_ci_unique'),
+        ]
+
     def __str__(self):
         return self.nombre
 
 
+class CancionQuerySet(models.QuerySet):
+    def with_usuario(self):
+        return self.select_related('usuario')
+
+
 class Cancion(models.Model):
     titulo = models.CharField(max_length=255)
-    archivo_url = models.TextField()
+    archivo = models.FileField(upload_to='canciones/%Y/%m/', max_length=512)
     usuario = models.ForeignKey(Usuario, on_delete=models.CASCADE, related_name='canciones')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = CancionQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['usuario', '-created_at'], name='cancion_usuario_created_idx'),
+        ]
+
     def __str__(self):
         return self.titulo
 
 
+class PlaylistQuerySet(models.QuerySet):
+    def with_songs(self):
+        return self.prefetch_related(
+            models.Prefetch(
+                'playlistcancion_set',
+                queryset=PlaylistCancion.objects.select_related('cancion'),
+            )
+        )
+
+
 class Playlist(models.Model):
     titulo = models.CharField(max_length=255)
     usuario = models.ForeignKey(Usuario, on_delete=models.CASCADE, related_name='playlists')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = PlaylistQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['usuario', '-created_at'], name='playlist_usuario_created_idx'),
+        ]
+
     def __str__(self):
         return self.titulo
 
@@ -34,7 +78,12 @@ class PlaylistCancion(models.Model):
     cancion = models.ForeignKey(Cancion, on_delete=models.CASCADE)
 
     class Meta:
-        unique_together = ('playlist', 'cancion')
+        constraints = [
+            models.UniqueConstraint(fields=['playlist', 'cancion'], name='playlistcancion_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['cancion', 'playlist'], name='playlistcancion_cancion_idx'),
+        ]
 
     def __str__(self):
         return f'{self.playlist.titulo} - {self.cancion.titulo}'